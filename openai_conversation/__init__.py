@@ -2,9 +2,17 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from decimal import Decimal
+from enum import Enum
+from functools import partial
+from operator import attrgetter
 from pathlib import Path
 from types import MappingProxyType
+from typing import Any
 
+import httpx
 import openai
 from openai.types.images_response import ImagesResponse
 from openai.types.responses import (
@@ -16,13 +24,30 @@ from openai.types.responses import (
 )
 import voluptuous as vol
 
+from homeassistant.components.calendar import DOMAIN as CALENDAR_DOMAIN
+from homeassistant.components.homeassistant import async_should_expose
+from homeassistant.components.homeassistant.exposed_entities import (
+    async_listen_entity_updates,
+)
+from homeassistant.components.script import DOMAIN as SCRIPT_DOMAIN
 from homeassistant.config_entries import ConfigEntry, ConfigSubentry
-from homeassistant.const import CONF_API_KEY, Platform
+from homeassistant.const import (
+    CONF_API_KEY,
+    EVENT_CORE_CONFIG_UPDATE,
+    EVENT_HOMEASSISTANT_CLOSE,
+    EVENT_STATE_CHANGED,
+    Platform,
+)
 from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
     HomeAssistant,
     ServiceCall,
     ServiceResponse,
+    State,
     SupportsResponse,
+    callback,
 )
 from homeassistant.exceptions import (
     ConfigEntryAuthFailed,
@@ -31,14 +56,18 @@ from homeassistant.exceptions import (
     ServiceValidationError,
 )
 from homeassistant.helpers import (
+    area_registry as ar,
     config_validation as cv,
     device_registry as dr,
     entity_registry as er,
+    intent,
     issue_registry as ir,
     selector,
 )
-from homeassistant.helpers.httpx_client import get_async_client
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.util import dt as dt_util
+from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.ssl import get_default_context
 
 from .const import (
     CONF_CHAT_MODEL,
@@ -71,50 +100,61 @@ SERVICE_GENERATE_CONTENT = "generate_content"
 PLATFORMS = (Platform.AI_TASK, Platform.CONVERSATION, Platform.STT, Platform.TTS)
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
+_GENERATE_CONTENT_SCHEMA = vol.Schema(
+    {
+        vol.Required("config_entry"): selector.ConfigEntrySelector(
+            {
+                "integration": DOMAIN,
+            }
+        ),
+        vol.Required(CONF_PROMPT): cv.string,
+        vol.Optional(CONF_FILENAMES, default=[]): vol.All(cv.ensure_list, [cv.string]),
+    }
+)
+_GENERATE_IMAGE_SCHEMA = vol.Schema(
+    {
+        vol.Required("config_entry"): selector.ConfigEntrySelector(
+            {
+                "integration": DOMAIN,
+            }
+        ),
+        vol.Required(CONF_PROMPT): cv.string,
+        vol.Optional("size", default="1024x1024"): vol.In(
+            ("1024x1024", "1024x1792", "1792x1024")
+        ),
+        vol.Optional("quality", default="standard"): vol.In(("standard", "hd")),
+        vol.Optional("style", default="vivid"): vol.In(("vivid", "natural")),
+    }
+)
+
 type OpenAIConfigEntry = ConfigEntry[openai.AsyncClient]
 
-# === Begin Heinous Monkey Patching Crimes ===
 
-from homeassistant.helpers import llm as patched_llm
+@dataclass
+class _PooledClient:
+    """OpenAI client shared by the config entries using the same API key."""
 
-# Bastardized copy of _get_exposed_entities from llm.py as of https://github.com/home-assistant/core/blob/2026.4.1/homeassistant/helpers/llm.py
-# Fixes issues related to 0-255 brightness representation
-# Issues #134848, #134592
-def _custom_get_exposed_entities(
-    hass: HomeAssistant,
-    assistant: str,
-    include_state: bool = True,
-) -> dict[str, dict[str, dict[str, Any]]]:
-    """Get exposed entities.
+    client: openai.AsyncOpenAI
+    refs: int = 0
 
-    Splits out calendars and scripts.
-    """
 
-    from operator import attrgetter
-
-    from enum import Enum
-    from decimal import Decimal
-    from homeassistant.helpers import (
-        area_registry as ar,
-        config_validation as cv,
-        device_registry as dr,
-        entity_registry as er,
-        floor_registry as fr,
-        intent,
-        selector,
-        service,
-    )
-    from homeassistant.components.homeassistant import async_should_expose
-    from homeassistant.components.script import DOMAIN as SCRIPT_DOMAIN
-    from homeassistant.components.todo import DOMAIN as TODO_DOMAIN, TodoServices
-    from homeassistant.components.calendar import (
-        DOMAIN as CALENDAR_DOMAIN
-    )
+DATA_CLIENTS: HassKey[dict[str, _PooledClient]] = HassKey(f"{DOMAIN}_clients")
+DATA_ENTRY_CLIENTS: HassKey[dict[str, openai.AsyncOpenAI]] = HassKey(
+    f"{DOMAIN}_entry_clients"
+)
+DATA_HTTP_CLIENT: HassKey[httpx.AsyncClient] = HassKey(f"{DOMAIN}_http_client")
+DATA_HTTP_CLIENT_CLOSE_UNSUB: HassKey[CALLBACK_TYPE] = HassKey(
+    f"{DOMAIN}_http_client_close_unsub"
+)
+DATA_PLATFORM_HEADERS: HassKey[dict[str, str]] = HassKey(f"{DOMAIN}_platform_headers")
+HTTP_CLIENT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
 
-    area_registry = ar.async_get(hass)
-    entity_registry = er.async_get(hass)
-    device_registry = dr.async_get(hass)
-    interesting_attributes = {
+# === Begin Heinous Monkey Patching Crimes ===
+
+from homeassistant.helpers import llm as patched_llm
+
+_INTERESTING_ATTRIBUTES = frozenset(
+    {
         "temperature",
         "current_temperature",
         "temperature_unit",
@@ -129,87 +169,296 @@ def _custom_get_exposed_entities(
         "media_artist",
         "media_album_name",
     }
+)
+_SPLIT_DOMAINS = frozenset({SCRIPT_DOMAIN, CALENDAR_DOMAIN})
+_BRIGHTNESS_SCALE = 100.0 / 255.0
+_BRIGHTNESS_LUT = bytes(round(value * _BRIGHTNESS_SCALE) for value in range(256))
+
+
+def _identity(value: Any) -> Any:
+    """Return an attribute value unchanged."""
+    return value
+
+
+# Keyed on the exact type, subclasses fall back to the isinstance checks
+_ATTRIBUTE_CONVERTERS: dict[type, Callable[[Any], Any]] = {
+    str: _identity,
+    float: _identity,
+    int: str,
+    bool: str,
+    Decimal: str,
+}
+
+
+def _convert_attributes(attrs: Mapping[str, Any]) -> dict[str, Any]:
+    """Return the interesting attributes of a state converted for the prompt."""
+    attributes = {}
+    for attr_name, attr_value in attrs.items():
+        if attr_name in _INTERESTING_ATTRIBUTES:
+            if attr_name == "brightness" and isinstance(attr_value, (int, float)):
+                # Convert brightness 0–255 to 0–100
+                if isinstance(attr_value, int) and 0 <= attr_value <= 255:
+                    attributes[attr_name] = _BRIGHTNESS_LUT[attr_value]
+                else:
+                    attributes[attr_name] = round(attr_value * _BRIGHTNESS_SCALE)
+            elif (converter := _ATTRIBUTE_CONVERTERS.get(type(attr_value))) is not None:
+                attributes[attr_name] = converter(attr_value)
+            elif isinstance(attr_value, (Enum, Decimal, int)):
+                attributes[attr_name] = str(attr_value)
+            else:
+                attributes[attr_name] = attr_value
+    return attributes
+
+
+# Bastardized copy of _get_exposed_entities from llm.py as of https://github.com/home-assistant/core/blob/2026.4.1/homeassistant/helpers/llm.py
+# Fixes issues related to 0-255 brightness representation
+# Issues #134848, #134592
+def _build_entity_info(
+    hass: HomeAssistant,
+    state: State,
+    include_state: bool,
+    entity_registry: er.EntityRegistry,
+    device_registry: dr.DeviceRegistry,
+    area_registry: ar.AreaRegistry,
+) -> dict[str, Any]:
+    """Get the info of a single exposed entity."""
+    entity_entry = entity_registry.async_get(state.entity_id)
+    names = intent.async_get_entity_aliases(hass, entity_entry, state=state)
+    area_entry = None
+
+    if entity_entry is not None:
+        # Entity area, falling back to the device area
+        if entity_entry.area_id is not None:
+            area_entry = area_registry.async_get_area(entity_entry.area_id)
+        if (
+            area_entry is None
+            and entity_entry.device_id is not None
+            and (device_entry := device_registry.async_get(entity_entry.device_id))
+            is not None
+            and device_entry.area_id is not None
+        ):
+            area_entry = area_registry.async_get_area(device_entry.area_id)
+
+    info: dict[str, Any] = {
+        "names": ", ".join(names),
+        "domain": state.domain,
+    }
+
+    if include_state:
+        entity_state = state.state
+        attrs = state.attributes
+
+        # Convert timestamp device_class states from UTC to local time
+        if (
+            attrs.get("device_class") == "timestamp"
+            and entity_state
+            and (parsed_utc := dt_util.parse_datetime(entity_state)) is not None
+        ):
+            info["state"] = dt_util.as_local(parsed_utc).isoformat()
+        else:
+            info["state"] = entity_state
+
+    if area_entry is not None:
+        info["areas"] = ", ".join((area_entry.name, *area_entry.aliases))
+
+    # NOTE - _convert_attributes is the only change from the original function
+    if include_state and (attributes := _convert_attributes(attrs)):
+        info["attributes"] = attributes
+
+    return info
+
+
+def _build_exposed_entity_infos(
+    hass: HomeAssistant,
+    assistant: str,
+    include_state: bool,
+) -> dict[str, dict[str, Any]]:
+    """Get the info of every exposed entity, ordered by name."""
+    area_registry = ar.async_get(hass)
+    entity_registry = er.async_get(hass)
+    device_registry = dr.async_get(hass)
+
+    # Filter before sorting, most states are usually not exposed
+    should_expose = partial(async_should_expose, hass, assistant)
+    exposed_states = sorted(
+        (state for state in hass.states.async_all() if should_expose(state.entity_id)),
+        key=attrgetter("name"),
+    )
+    infos = {
+        state.entity_id: _build_entity_info(
+            hass, state, include_state, entity_registry, device_registry, area_registry
+        )
+        for state in exposed_states
+    }
+    return infos
+
 
-    entities = {}
+def _split_exposed_entities(
+    infos: dict[str, dict[str, Any]],
+) -> dict[str, dict[str, dict[str, Any]]]:
+    """Get exposed entities.
+
+    Splits out calendars and scripts.
+    """
     data: dict[str, dict[str, Any]] = {
         SCRIPT_DOMAIN: {},
         CALENDAR_DOMAIN: {},
+        "entities": {},
     }
 
-    for state in sorted(hass.states.async_all(), key=attrgetter("name")):
-        if not async_should_expose(hass, assistant, state.entity_id):
-            continue
+    for entity_id, info in infos.items():
+        domain = info["domain"]
+        data[domain if domain in _SPLIT_DOMAINS else "entities"][entity_id] = info
+
+    return data
+
+
+class _ExposedEntitiesCache:
+    """Exposed entities kept up to date from state and registry changes.
 
-        entity_entry = entity_registry.async_get(state.entity_id)
-        device_entry = (
-            device_registry.async_get(entity_entry.device_id)
-            if entity_entry is not None and entity_entry.device_id is not None
-            else None
+    The info of each exposed entity is kept per assistant. State changes mark
+    the entity dirty and only dirty entities are rebuilt on the next request.
+    Changes that can affect which
+    entities are exposed, their names, order or areas drop everything.
+    Results are shared between callers and must not be mutated.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache and subscribe to change events."""
+        self.hass = hass
+        self.refs = 0
+        self.infos: dict[tuple[str, bool], dict[str, dict[str, Any]]] = {}
+        self.results: dict[tuple[str, bool], dict[str, dict[str, Any]]] = {}
+        self._dirty: dict[tuple[str, bool], set[str]] = {}
+        self._assistants: set[str] = set()
+        self._unsubs: list[CALLBACK_TYPE] = [
+            hass.bus.async_listen(event_type, self._async_invalidate)
+            for event_type in (
+                er.EVENT_ENTITY_REGISTRY_UPDATED,
+                dr.EVENT_DEVICE_REGISTRY_UPDATED,
+                ar.EVENT_AREA_REGISTRY_UPDATED,
+                EVENT_CORE_CONFIG_UPDATE,
+            )
+        ]
+        self._unsubs.append(
+            hass.bus.async_listen(EVENT_STATE_CHANGED, self._async_state_changed)
         )
-        names = intent.async_get_entity_aliases(hass, entity_entry, state=state)
-        area_names = []
 
-        if entity_entry is not None:
-            if (
-                entity_entry.area_id is not None
-                and (area_entry := area_registry.async_get_area(entity_entry.area_id))
-                is not None
-            ):
-                # Entity is in area
-                area_names.append(area_entry.name)
-                area_names.extend(area_entry.aliases)
-            elif device_entry is not None:
-                # Check device area
-                if (
-                    device_entry.area_id is not None
-                    and (
-                        area_entry := area_registry.async_get_area(device_entry.area_id)
-                    )
-                    is not None
-                ):
-                    area_names.append(area_entry.name)
-                    area_names.extend(area_entry.aliases)
-
-        info: dict[str, Any] = {
-            "names": ", ".join(names),
-            "domain": state.domain,
-        }
+    @callback
+    def async_get(
+        self, assistant: str, include_state: bool
+    ) -> dict[str, dict[str, dict[str, Any]]]:
+        """Return the exposed entities, building them on a cache miss."""
+        key = (assistant, include_state)
+        if (data := self.results.get(key)) is not None:
+            return data
+
+        if assistant not in self._assistants:
+            # Expose settings of unregistered entities do not touch the registry
+            self._assistants.add(assistant)
+            self._unsubs.append(
+                async_listen_entity_updates(self.hass, assistant, self.async_clear)
+            )
 
-        if include_state:
-            info["state"] = state.state
-
-            # Convert timestamp device_class states from UTC to local time
-            if state.attributes.get("device_class") == "timestamp" and state.state:
-                if (parsed_utc := dt_util.parse_datetime(state.state)) is not None:
-                    info["state"] = dt_util.as_local(parsed_utc).isoformat()
-
-        if area_names:
-            info["areas"] = ", ".join(area_names)
-
-        # NOTE - this block is the only chang e from the original function
-        if include_state:
-            attributes = {}
-            for attr_name, attr_value in state.attributes.items():
-                if attr_name in interesting_attributes:
-                    if attr_name == "brightness" and isinstance(attr_value, (int, float)):
-                        # Convert brightness 0–255 to 0–100
-                        attributes[attr_name] = round((attr_value / 255.0) * 100)
-                    elif isinstance(attr_value, (Enum, Decimal, int)):
-                        attributes[attr_name] = str(attr_value)
-                    else:
-                        attributes[attr_name] = attr_value
-
-            if attributes:
-                info["attributes"] = attributes
-        # End of changes
-
-        if state.domain in data:
-            data[state.domain][state.entity_id] = info
-        else:
-            entities[state.entity_id] = info
+        if (infos := self.infos.get(key)) is None:
+            infos = self.infos[key] = _build_exposed_entity_infos(
+                self.hass, assistant, include_state
+            )
+        elif dirty := self._dirty.pop(key, None):
+            entity_registry = er.async_get(self.hass)
+            device_registry = dr.async_get(self.hass)
+            area_registry = ar.async_get(self.hass)
+            for entity_id in dirty:
+                if (state := self.hass.states.get(entity_id)) is None:
+                    continue
+                # Replacing the value keeps the entity in place in the name order
+                infos[entity_id] = _build_entity_info(
+                    self.hass,
+                    state,
+                    include_state,
+                    entity_registry,
+                    device_registry,
+                    area_registry,
+                )
+        data = self.results[key] = _split_exposed_entities(infos)
+        return data
+
+    @callback
+    def async_clear(self) -> None:
+        """Drop everything, to be rebuilt on the next request."""
+        self.infos.clear()
+        self.results.clear()
+        self._dirty.clear()
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Unsubscribe from change events and drop everything."""
+        while self._unsubs:
+            self._unsubs.pop()()
+        self.async_clear()
+
+    @callback
+    def _async_invalidate(self, event: Event) -> None:
+        """Drop everything when names, areas, expose settings or time zone change."""
+        self.async_clear()
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Mark the changed entity dirty where its info includes state."""
+        if not self.infos:
+            return
+
+        old_state = event.data["old_state"]
+        new_state = event.data["new_state"]
+        if old_state is None or new_state is None or old_state.name != new_state.name:
+            # Entity added, removed or renamed, which changes exposure and order
+            self.async_clear()
+            return
+
+        entity_id = event.data["entity_id"]
+        for key, infos in self.infos.items():
+            if key[1] and entity_id in infos:
+                self._dirty.setdefault(key, set()).add(entity_id)
+                self.results.pop(key, None)
+
+
+DATA_EXPOSED_ENTITIES_CACHE: HassKey[_ExposedEntitiesCache] = HassKey(
+    f"{DOMAIN}_exposed_entities_cache"
+)
+
+
+def _custom_get_exposed_entities(
+    hass: HomeAssistant,
+    assistant: str,
+    include_state: bool = True,
+) -> dict[str, dict[str, dict[str, Any]]]:
+    """Get exposed entities, reusing results until something relevant changes.
+
+    Results are only cached while a config entry is loaded.
+    """
+    if (cache := hass.data.get(DATA_EXPOSED_ENTITIES_CACHE)) is None:
+        return _split_exposed_entities(
+            _build_exposed_entity_infos(hass, assistant, include_state)
+        )
+    return cache.async_get(assistant, include_state)
 
-    data["entities"] = entities
-    return data
+
+@callback
+def _async_acquire_exposed_entities_cache(hass: HomeAssistant) -> None:
+    """Start caching exposed entities, or keep the cache alive for an entry."""
+    if (cache := hass.data.get(DATA_EXPOSED_ENTITIES_CACHE)) is None:
+        cache = hass.data[DATA_EXPOSED_ENTITIES_CACHE] = _ExposedEntitiesCache(hass)
+    cache.refs += 1
+
+
+@callback
+def _async_release_exposed_entities_cache(hass: HomeAssistant) -> None:
+    """Release the exposed entities cache, tearing it down when unused."""
+    cache = hass.data[DATA_EXPOSED_ENTITIES_CACHE]
+    cache.refs -= 1
+    if not cache.refs:
+        del hass.data[DATA_EXPOSED_ENTITIES_CACHE]
+        cache.async_shutdown()
 
 patched_llm._get_exposed_entities = _custom_get_exposed_entities
 
@@ -238,17 +487,15 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         )
 
         entry_id = call.data["config_entry"]
-        entry = hass.config_entries.async_get_entry(entry_id)
+        client = hass.data.get(DATA_ENTRY_CLIENTS, {}).get(entry_id)
 
-        if entry is None or entry.domain != DOMAIN:
+        if client is None:
             raise ServiceValidationError(
                 translation_domain=DOMAIN,
                 translation_key="invalid_config_entry",
                 translation_placeholders={"config_entry": entry_id},
             )
 
-        client: openai.AsyncClient = entry.runtime_data
-
         try:
             response: ImagesResponse = await client.images.generate(
                 model="dall-e-3",
@@ -260,7 +507,8 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                 n=1,
             )
         except openai.AuthenticationError as err:
-            entry.async_start_reauth(hass)
+            if (entry := hass.config_entries.async_get_entry(entry_id)) is not None:
+                entry.async_start_reauth(hass)
             raise HomeAssistantError("Authentication error") from err
         except openai.OpenAIError as err:
             raise HomeAssistantError(f"Error generating image: {err}") from err
@@ -268,7 +516,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         if not response.data or not response.data[0].url:
             raise HomeAssistantError("No image returned")
 
-        return response.data[0].model_dump(exclude={"b64_json"})
+        return response.data[0].model_dump(include={"url", "revised_prompt"})
 
     async def send_prompt(call: ServiceCall) -> ServiceResponse:
         """Send a prompt to ChatGPT and return the response."""
@@ -375,19 +623,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         DOMAIN,
         SERVICE_GENERATE_CONTENT,
         send_prompt,
-        schema=vol.Schema(
-            {
-                vol.Required("config_entry"): selector.ConfigEntrySelector(
-                    {
-                        "integration": DOMAIN,
-                    }
-                ),
-                vol.Required(CONF_PROMPT): cv.string,
-                vol.Optional(CONF_FILENAMES, default=[]): vol.All(
-                    cv.ensure_list, [cv.string]
-                ),
-            }
-        ),
+        schema=_GENERATE_CONTENT_SCHEMA,
         supports_response=SupportsResponse.ONLY,
     )
 
@@ -395,21 +631,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         DOMAIN,
         SERVICE_GENERATE_IMAGE,
         render_image,
-        schema=vol.Schema(
-            {
-                vol.Required("config_entry"): selector.ConfigEntrySelector(
-                    {
-                        "integration": DOMAIN,
-                    }
-                ),
-                vol.Required(CONF_PROMPT): cv.string,
-                vol.Optional("size", default="1024x1024"): vol.In(
-                    ("1024x1024", "1024x1792", "1792x1024")
-                ),
-                vol.Optional("quality", default="standard"): vol.In(("standard", "hd")),
-                vol.Optional("style", default="vivid"): vol.In(("vivid", "natural")),
-            }
-        ),
+        schema=_GENERATE_IMAGE_SCHEMA,
         supports_response=SupportsResponse.ONLY,
     )
 
@@ -418,22 +640,30 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
 async def async_setup_entry(hass: HomeAssistant, entry: OpenAIConfigEntry) -> bool:
     """Set up OpenAI Conversation from a config entry."""
-    client = openai.AsyncOpenAI(
-        api_key=entry.data[CONF_API_KEY],
-        http_client=get_async_client(hass),
-    )
-
-    # Cache current platform data which gets added to each request (caching done by library)
-    _ = await hass.async_add_executor_job(client.platform_headers)
+    api_key = entry.data[CONF_API_KEY]
+    client = _async_acquire_client(hass, api_key)
+    entry.async_on_unload(partial(_async_release_client, hass, api_key))
+    _async_acquire_exposed_entities_cache(hass)
+    entry.async_on_unload(partial(_async_release_exposed_entities_cache, hass))
+
+    if DATA_PLATFORM_HEADERS not in hass.data:
+        # Cache current platform data which gets added to each request (caching done
+        # by library). Resolving it reads OS release files, so it has to happen in the
+        # executor, but only once as the library cache is process wide.
+        hass.data[DATA_PLATFORM_HEADERS] = await hass.async_add_executor_job(
+            client.platform_headers
+        )
 
     try:
-        await hass.async_add_executor_job(client.with_options(timeout=10.0).models.list)
+        await client.with_options(timeout=10.0).models.list()
     except openai.AuthenticationError as err:
         raise ConfigEntryAuthFailed(err) from err
     except openai.OpenAIError as err:
         raise ConfigEntryNotReady(err) from err
 
     entry.runtime_data = client
+    hass.data.setdefault(DATA_ENTRY_CLIENTS, {})[entry.entry_id] = client
+    entry.async_on_unload(partial(_async_remove_entry_client, hass, entry.entry_id))
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
@@ -452,6 +682,72 @@ async def async_update_options(hass: HomeAssistant, entry: OpenAIConfigEntry) ->
     await hass.config_entries.async_reload(entry.entry_id)
 
 
+@callback
+def _async_get_http_client(hass: HomeAssistant) -> httpx.AsyncClient:
+    """Return the HTTP client shared by all config entries.
+
+    Kept separate from the Home Assistant shared client so OpenAI traffic
+    gets its own connection pool sized for concurrent tool calls.
+    """
+    if (http_client := hass.data.get(DATA_HTTP_CLIENT)) is not None:
+        return http_client
+
+    http_client = hass.data[DATA_HTTP_CLIENT] = httpx.AsyncClient(
+        verify=get_default_context(), limits=HTTP_CLIENT_LIMITS
+    )
+
+    async def _async_close_http_client(event: Event) -> None:
+        """Close the HTTP client, config entries are not unloaded on shutdown."""
+        hass.data.pop(DATA_HTTP_CLIENT_CLOSE_UNSUB, None)
+        await http_client.aclose()
+
+    hass.data[DATA_HTTP_CLIENT_CLOSE_UNSUB] = hass.bus.async_listen_once(
+        EVENT_HOMEASSISTANT_CLOSE, _async_close_http_client
+    )
+    return http_client
+
+
+@callback
+def _async_acquire_client(hass: HomeAssistant, api_key: str) -> openai.AsyncOpenAI:
+    """Return the pooled client for an API key, creating it if needed."""
+    clients = hass.data.setdefault(DATA_CLIENTS, {})
+    if (pooled := clients.get(api_key)) is None:
+        pooled = clients[api_key] = _PooledClient(
+            openai.AsyncOpenAI(
+                api_key=api_key,
+                http_client=_async_get_http_client(hass),
+                # Pin the library defaults so the client never adopts the
+                # timeout of the shared httpx client
+                max_retries=openai.DEFAULT_MAX_RETRIES,
+                timeout=openai.DEFAULT_TIMEOUT,
+            )
+        )
+    pooled.refs += 1
+    return pooled.client
+
+
+@callback
+def _async_remove_entry_client(hass: HomeAssistant, entry_id: str) -> None:
+    """Forget the client of an unloaded config entry."""
+    del hass.data[DATA_ENTRY_CLIENTS][entry_id]
+
+
+async def _async_release_client(hass: HomeAssistant, api_key: str) -> None:
+    """Release a pooled client, closing the connection pool when unused."""
+    clients = hass.data[DATA_CLIENTS]
+    pooled = clients[api_key]
+    pooled.refs -= 1
+    if pooled.refs:
+        return
+
+    # The client itself is not closed as that would close the shared pool
+    del clients[api_key]
+    if not clients and (http_client := hass.data.pop(DATA_HTTP_CLIENT, None)):
+        if unsub := hass.data.pop(DATA_HTTP_CLIENT_CLOSE_UNSUB, None):
+            unsub()
+        await http_client.aclose()
+
+
 async def async_migrate_integration(hass: HomeAssistant) -> None:
     """Migrate integration entry structure."""
 